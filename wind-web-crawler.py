@@ -12,14 +12,25 @@ CSV columns (always quoted):
   "URL","keywords","description","title"
 """
 
-import argparse, csv, hashlib, math, random, sys, time, cmath, requests
-from collections import defaultdict
+import argparse, csv, functools, hashlib, json, math, multiprocessing, os, random, re, sys, time, cmath, requests
+from collections import defaultdict, deque
+from concurrent.futures import (FIRST_COMPLETED, Future, ProcessPoolExecutor,
+                                ThreadPoolExecutor, wait)
+from concurrent.futures.process import BrokenProcessPool
 from pathlib import Path
-from urllib.parse import urldefrag, urljoin, urlparse
+from urllib.parse import urljoin, urlparse
 from urllib.robotparser import RobotFileParser
-from bs4 import BeautifulSoup
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+import numpy as np
+from selectolax.lexbor import LexborHTMLParser
 from tqdm import tqdm
 
+try:                                    # optional: fast 64-bit URL/host hashes
+    from xxhash import xxh3_64_intdigest, xxh64_intdigest
+except ImportError:
+    xxh3_64_intdigest = xxh64_intdigest = None
+
 # ─── HTTP & politeness ───────────────────────────────────────────────
 UA = ("WindCrawler/2.2 - Mozilla Compatible")
 
@@ -27,187 +38,392 @@ CONNECT_TIMEOUT = 2      # DNS + TCP handshake seconds
 READ_TIMEOUT    = 3     # socket idle seconds
 THROTTLE        = 1.0    # gap between requests to same host
 MAX_BYTES_PER_HOST = 1_000_000
+MAX_BYTES_PER_PAGE = 512_000    # single response; below the host cap
+WORKERS         = 32     # concurrent fetches, at most one per host
+POOL_SIZE       = 256    # keep-alive connections cached across hosts
+ROBOTS_TTL      = 86_400 # seconds a cached robots.txt stays valid
+CSV_BATCH       = 64     # rows buffered before each writerows()
+HTTP_CACHE      = "crawl_cache.sqlite"
+CACHE_TTL       = 86_400 # seconds a cached response stays fresh
 
 # ─── URL helpers ─────────────────────────────────────────────────────
-def canon(url: str) -> str:
-    url = urldefrag(url)[0]
-    p = urlparse(url)
-    return p._replace(scheme=p.scheme.lower(),
-                      netloc=p.netloc.lower()).geturl()
+_SCHEME_NETLOC_RE = re.compile(r"([a-zA-Z][a-zA-Z0-9+.-]*://)([^/?#]*)")
 
-def within_scope(url): return urlparse(url).scheme in {"http", "https"}
+def canon(url: str) -> str:
+    i = url.find("#")                          # drop fragment
+    if i >= 0: url = url[:i]
+    m = _SCHEME_NETLOC_RE.match(url)           # lowercase scheme + netloc
+    if not m: return url
+    return m.group(1).lower() + m.group(2).lower() + url[m.end():]
+
+@functools.lru_cache(maxsize=100_000)
+def _parsed(url): return urlparse(url)        # urlparse's own cache is small
+
+# visited/cluster sets hold 64-bit keys rather than whole URL strings
+def url_key(url):
+    return xxh64_intdigest(url.encode()) if xxh64_intdigest else hash(url)
+
+def within_scope(url): return _parsed(url).scheme in {"http", "https"}
+
+# ─── robots.txt cache ───────────────────────────────────────────────
+# Entries are [fetched_at, status, lines] keyed by host, kept as plain JSON
+# so later runs skip hosts whose robots.txt was fetched within ROBOTS_TTL.
+def load_robots(path):
+    try:
+        entries = json.loads(Path(path).read_text())
+    except (OSError, ValueError):
+        return {}
+    now = time.time()
+    return {h: e for h, e in entries.items() if now - e[0] < ROBOTS_TTL}
+
+def save_robots(path, entries):
+    Path(path).write_text(json.dumps(entries))
+
+def robots_parser(status, lines):
+    rp = RobotFileParser()
+    if status in (401, 403) or status >= 500:  # 5xx: unknown, so stay off
+        rp.disallow_all = True
+    elif status >= 400:                        # 4xx: no robots.txt
+        rp.allow_all = True
+    else:
+        rp.parse(lines)
+    return rp
+
+# ─── HTTP session (pooled, optionally cached) ───────────────────────
+def cacheable(r):
+    # Caching reads the whole body, so only store what polite_get would read
+    # anyway: HTML (or a robots.txt) whose declared size fits its byte cap.
+    n, ctype = r.headers.get("content-length", ""), r.headers.get("content-type", "")
+    wanted = ("text/html" in ctype or
+              ("text/plain" in ctype and _parsed(r.url).path == "/robots.txt"))
+    return (wanted and n.isdigit()
+            and int(n) <= min(MAX_BYTES_PER_PAGE, MAX_BYTES_PER_HOST))
+
+def make_session(workers, http_cache=None):
+    try:                                # optional: on-disk HTTP cache
+        import requests_cache
+    except ImportError:
+        requests_cache = None
+    if http_cache and requests_cache:
+        sess = requests_cache.CachedSession(http_cache, expire_after=CACHE_TTL,
+                                            allowable_codes=(200,),
+                                            cache_control=True,
+                                            filter_fn=cacheable)
+    else:
+        sess = requests.Session()
+    adapter = HTTPAdapter(pool_connections=max(POOL_SIZE, workers),
+                          pool_maxsize=max(POOL_SIZE, workers),
+                          max_retries=Retry(total=2, backoff_factor=0.3))
+    sess.mount("http://", adapter); sess.mount("https://", adapter)
+    sess.headers["User-Agent"] = UA
+    return sess
+
+def cached(sess, url):
+    # A fresh cached copy is served without contacting the host, so it
+    # doesn't have to wait out THROTTLE.
+    cache = getattr(sess, "cache", None)
+    if cache is None:
+        return False
+    r = cache.get_response(cache.create_key(requests.Request("GET", url)))
+    return r is not None and not r.is_expired
 
 # ─── HTTP fetch with robots/timeout/throttle ────────────────────────
-def polite_get(sess, url, host_last, host_bytes, robots):
-    host = urlparse(url).netloc
+# crawl() only dispatches a URL once its host is idle and THROTTLE has passed
+# since host_last, so a worker never waits here and no two touch one host.
+def polite_get(sess, url, host_last, host_bytes, robots, robots_txt):
+    p = _parsed(url)
+    host = p.netloc
 
     if host not in robots:                                 # robots.txt
-        rp = RobotFileParser()
         try:
-            rp.set_url(f"{urlparse(url).scheme}://{host}/robots.txt")
-            rp.read()
+            r = sess.get(f"{p.scheme}://{host}/robots.txt",
+                         timeout=(CONNECT_TIMEOUT, READ_TIMEOUT))
+            lines = r.text.splitlines() if r.status_code < 400 else []
+            robots[host] = robots_parser(r.status_code, lines)
+            if r.status_code < 500:            # don't persist transient errors
+                robots_txt[host] = [time.time(), r.status_code, lines]
         except Exception:
-            rp.disallow_all = False
-        robots[host] = rp
+            robots[host] = RobotFileParser()
+            robots[host].allow_all = True
     if not robots[host].can_fetch(UA, url):
         raise PermissionError("robots.txt")
 
-    wait = THROTTLE - (time.time() - host_last[host])
-    if wait > 0:
-        time.sleep(wait)
-
-    r = sess.get(url,
-                 timeout=(CONNECT_TIMEOUT, READ_TIMEOUT),
-                 headers={"User-Agent": UA})
-    r.raise_for_status()
-    host_last[host] = time.time()
-
-    host_bytes[host] += len(r.content)
-    if host_bytes[host] > MAX_BYTES_PER_HOST:
-        raise MemoryError("byte cap")
-
-    return r.text, r.headers.get("content-type", "")
+    with sess.get(url, timeout=(CONNECT_TIMEOUT, READ_TIMEOUT), stream=True) as r:
+        r.raise_for_status()
+        if not getattr(r, "from_cache", False):
+            host_last[host] = time.time()
+
+        ctype = r.headers.get("content-type", "")
+        if "text/html" not in ctype:               # never download binaries
+            return "", ctype
+
+        # stream at most the remaining budget instead of buffering it all
+        budget = min(MAX_BYTES_PER_PAGE, MAX_BYTES_PER_HOST - host_bytes[host])
+        if budget <= 0 or int(r.headers.get("content-length") or 0) > budget:
+            raise MemoryError("byte cap")
+        body = r.raw.read(budget + 1, decode_content=True)
+        host_bytes[host] += len(body)
+        if len(body) > budget:
+            raise MemoryError("byte cap")
+
+    try:
+        return body.decode(r.encoding or "utf-8", errors="replace"), ctype
+    except LookupError:                                # unknown charset
+        return body.decode("utf-8", errors="replace"), ctype
 
 # ─── HTML scraping ──────────────────────────────────────────────────
-def extract_links(html, base):
-    soup = BeautifulSoup(html, "html.parser")   # BS4 docs
-    return {canon(urljoin(base, a["href"]))
-            for a in soup.find_all("a", href=True)
-            if within_scope(urljoin(base, a["href"]))}
-
-def meta_tag(soup, names):
-    for n in names:
-        t = soup.find("meta", attrs={"name": n}) or soup.find("meta", attrs={"property": n})
-        if t and t.get("content"):
-            return t["content"].strip()
-    return ""
-
-def scrape_meta(html):
-    soup = BeautifulSoup(html, "html.parser")
-    return (meta_tag(soup, ["keywords", "og:keywords"]),
-            meta_tag(soup, ["description", "og:description"]),
-            soup.title.string.strip() if soup.title else "")
-
-# ─── Tiny quantum simulator (Hadamard & measurement) ───────────────
-H = [[1 / math.sqrt(2),  1 / math.sqrt(2)],
-     [1 / math.sqrt(2), -1 / math.sqrt(2)]]
-
-def kron(a, b):
-    return [[ai * bj for bj in row_b for ai in row_a]
-            for row_a in a for row_b in b]
-
-def nqubit_gate(single, target, n):
-    g = single
-    for q in range(n - 1, -1, -1):
-        g = kron(g, [[1, 0], [0, 1]]) if q != target else kron(g, [[1]])
-    return g
-
-def apply(g, state):
-    return [sum(g[i][j] * state[j] for j in range(len(state)))
-            for i in range(len(state))]
-
-def normalise(vec):
-    norm = math.sqrt(sum(abs(a)**2 for a in vec))
-    return [a / norm for a in vec] if norm else vec
-
-def measure(state):
-    r, acc = random.random(), 0.0
-    for i, amp in enumerate(state):
-        acc += abs(amp)**2
-        if r <= acc:
-            return i
-    return len(state) - 1
-
-def quantum_choice(items):
-    n = len(items)
-    q = math.ceil(math.log2(max(2, n)))
-    dim = 2 ** q
-
-    state = [0j] * dim; state[0] = 1
-    for qubit in range(q):
-        state = apply(nqubit_gate(H, qubit, q), state)
-
-    idx = measure(state)
-    while idx >= n:                       # discard padding states
-        idx = measure(state)
-    return items[idx]
+# hrefs that can never yield a new in-scope page: same-page fragments and
+# non-http schemes (mailto:, javascript:, tel: ...)
+_SKIP_HREF_RE = re.compile(r"#|(?!https?:)[a-zA-Z][a-zA-Z0-9+.-]*:", re.I)
+
+def extract_links(tree, base):
+    out = set()
+    for a in tree.css("a[href]"):
+        href = a.attributes["href"]
+        if not href or _SKIP_HREF_RE.match(href): continue
+        u = urljoin(base, href)
+        if within_scope(u): out.add(canon(u))
+    return out
+
+def meta_contents(tree):
+    metas = {}                                 # one walk over <meta> tags
+    for t in tree.css("meta"):
+        a = t.attributes
+        key = a.get("name") or a.get("property")
+        if key and a.get("content") and key not in metas:
+            metas[key] = a["content"].strip()
+    return metas
+
+def meta_tag(metas, names):
+    return next((metas[n] for n in names if n in metas), "")
+
+def scrape_meta(tree):
+    metas, title = meta_contents(tree), tree.css_first("title")
+    return (meta_tag(metas, ["keywords", "og:keywords"]),
+            meta_tag(metas, ["description", "og:description"]),
+            title.text(strip=True) if title else "")
+
+def parse_context():
+    # Parse workers start while fetch threads are running; forking a
+    # multi-threaded process can hand a child a lock held mid-request.
+    methods = multiprocessing.get_all_start_methods()
+    return multiprocessing.get_context("forkserver" if "forkserver" in methods
+                                       else "spawn")
+
+def _parse_page(html, url):
+    # Runs in a worker process: one parse yields the CSV fields and links.
+    tree = LexborHTMLParser(html)
+    return (*scrape_meta(tree), extract_links(tree, url))
+
+def parse_here(html, url):
+    # Same result as a parse-pool future, computed in this process.
+    fut = Future()
+    try:
+        fut.set_result(_parse_page(html, url))
+    except Exception as e:
+        fut.set_exception(e)
+    return fut
+
+# ─── Quantum choice (Hadamard & measurement) ───────────────────────
+def quantum_choice(n):
+    # Measuring H⊗…⊗H|0…0⟩ gives every basis state probability 1/2^q, and
+    # discarding padding states leaves a uniform draw over the n items, so
+    # sample that distribution directly instead of simulating the gates.
+    return random.randrange(n)
 
 # ─── Frontier with six traversal modes ──────────────────────────────
-def hash_angle(url):
-    h = int(hashlib.md5(urlparse(url).netloc.encode()).hexdigest(), 16)
+@functools.lru_cache(maxsize=65536)
+def hash_angle(netloc):
+    if xxh3_64_intdigest:                      # only needs a uniform integer
+        h = xxh3_64_intdigest(netloc.encode())
+    else:                                      # stable across runs, unlike hash()
+        h = int.from_bytes(hashlib.md5(netloc.encode()).digest()[:8], "big")
     return (h % 360_000) / 360_000 * 2 * math.pi
 
+def _wind_pick(angles, wind, rnd):
+    acc = np.cumsum(1.0 + (1.0 + np.cos(angles - wind)))
+    return min(np.searchsorted(acc, rnd * acc[-1]), len(angles) - 1)
+
+# numba and requests_cache are imported on first use rather than at module
+# level, so parse workers (which re-import this script) stay small.
+@functools.lru_cache(maxsize=None)
+def wind_picker():
+    try:                                # optional: JIT-compile the wind pick
+        from numba import njit
+    except ImportError:
+        return _wind_pick
+    return njit(cache=True)(_wind_pick)
+
 def levy_len(r, alpha=1.6): return max(1, int(r.paretovariate(alpha)))
 
+ORDER_FREE = {"brownian", "wind", "quantum"}    # pop position carries no meaning
+
 class Frontier:
+    # Queued URLs are kept as parallel arrays (url, netloc, angle) filled once
+    # at push time, so pop never re-parses or re-hashes a URL.
     def __init__(self, strategy, start, rnd=None):
         self.strategy = strategy
         self.rnd = rnd or random.Random()
-        self.queue = [start]
-        self.wind = hash_angle(start)
+        self.urls, self.netlocs = [], []
+        self._angles = np.empty(64, dtype=np.float32)
         self.momentum = None
-        self.cluster = {start}
+        self.cluster = set()
+        self.push_many([start])
+        self.cluster.add(url_key(start))
+        self.wind = float(self._angles[0])
 
-    def push_many(self, links):
+    @property
+    def angles(self): return self._angles[:len(self.urls)]
+
+    def push_many(self, links, visited=()):
+        dla = self.strategy == "dla"
         for u in links:
-            if self.strategy == "dla" and u in self.cluster: continue
-            self.queue.append(u)
+            k = url_key(u)
+            if k in visited or (dla and k in self.cluster): continue
+            n, netloc = len(self.urls), _parsed(u).netloc
+            if n == len(self._angles):                 # grow geometrically
+                self._angles = np.resize(self._angles, 2 * n)
+            self._angles[n] = hash_angle(netloc)
+            self.urls.append(u); self.netlocs.append(netloc)
 
     def pop(self):
-        if not self.queue: raise IndexError
+        if not self.urls: raise IndexError
         strat = self.strategy
 
         if strat == "brownian":
-            idx = self.rnd.randrange(len(self.queue))
+            idx = self.rnd.randrange(len(self.urls))
         elif strat == "levy":
-            idx = self.rnd.randrange(min(levy_len(self.rnd), len(self.queue)))
+            idx = self.rnd.randrange(min(levy_len(self.rnd), len(self.urls)))
         elif strat == "ballistic":
             if self.momentum and self.rnd.random() < 0.85:
-                idx = next((i for i, u in enumerate(self.queue)
-                            if urlparse(u).netloc == self.momentum), 0)
+                idx = next((i for i, n in enumerate(self.netlocs)
+                            if n == self.momentum), 0)
             else:
                 idx = 0
-            self.momentum = urlparse(self.queue[idx]).netloc
+            self.momentum = self.netlocs[idx]
         elif strat == "wind":
-            wt = [1 + 2 * (1 + math.cos(hash_angle(u) - self.wind)) / 2
-                  for u in self.queue]
-            s = self.rnd.random() * sum(wt); acc = 0
-            for i, w in enumerate(wt):
-                acc += w
-                if s <= acc: idx = i; break
+            idx = int(wind_picker()(self.angles, self.wind, self.rnd.random()))
         elif strat == "dla":
             idx = 0
         elif strat == "quantum":
-            chosen = quantum_choice(self.queue)
-            idx = self.queue.index(chosen)
+            idx = quantum_choice(len(self.urls))
         else:
             idx = 0
-        return self.queue.pop(idx)
+        return self._take(idx)
+
+    def _take(self, idx):
+        url, last = self.urls[idx], len(self.urls) - 1
+        if self.strategy in ORDER_FREE:                # swap with last, O(1)
+            self.urls[idx], self.netlocs[idx] = self.urls[last], self.netlocs[last]
+            self._angles[idx] = self._angles[last]
+            self.urls.pop(); self.netlocs.pop()
+        else:                                          # keep queue order
+            del self.urls[idx], self.netlocs[idx]
+            self._angles[idx:last] = self._angles[idx + 1:last + 1]
+        return url
 
 # ─── Main crawl loop ───────────────────────────────────────────────
-def crawl(seeds, strategy, max_pages, writer):
-    sess = requests.Session()
+def crawl(seeds, strategy, max_pages, writer, workers=WORKERS, robots_cache=None,
+          http_cache=None, parsers=None):
+    sess = make_session(workers, http_cache)
     frontier = Frontier(strategy, seeds[0]); frontier.push_many(seeds[1:])
 
-    visited, host_last, host_bytes, robots = set(), defaultdict(float), defaultdict(int), {}
+    visited, host_last, host_bytes = set(), defaultdict(float), defaultdict(int)
+    robots_txt = load_robots(robots_cache) if robots_cache else {}
+    robots = {h: robots_parser(*e[1:]) for h, e in robots_txt.items()}
+    inflight, parsing, rows = {}, {}, []       # future -> url / (url, html)
+    pool_ok = True                             # False once a parse worker died
+    busy, parked = set(), defaultdict(deque)   # hosts in flight; host -> waiting URLs
     bar = tqdm(total=max_pages, desc=f"{strategy} crawl")
 
-    while frontier.queue and len(visited) < max_pages:
-        url = frontier.pop()
-        if url in visited: continue
-        try:
-            html, ctype = polite_get(sess, url, host_last, host_bytes, robots)
-            visited.add(url); bar.update(1)
-            if "text/html" in ctype:
-                kw, desc, title = scrape_meta(html)
-                writer.writerow([url, kw, desc, title])
-                frontier.push_many(extract_links(html, url) - visited)
-                if strategy == "dla": frontier.cluster.add(url)
-        except (PermissionError, MemoryError, requests.exceptions.Timeout):
-            continue
-        except Exception:
-            continue
-    bar.close()
+    # Fetches run on worker threads and parsing on worker processes; the
+    # frontier, per-host scheduling and the CSV writer stay on this thread.
+    # A URL whose host is busy or not yet due is parked until it is, so the
+    # workers stay spread across hosts instead of queueing behind one.
+    try:
+        with ThreadPoolExecutor(max_workers=workers) as pool, \
+             ProcessPoolExecutor(max_workers=parsers or os.cpu_count(),
+                                 mp_context=parse_context()) as parse_pool:
+            while True:
+                now = time.time()
+                ready = [h for h in parked if h not in busy and
+                         (now - host_last[h] >= THROTTLE or cached(sess, parked[h][0]))]
+                candidates = [parked[h].popleft() for h in ready]
+                for h in ready:
+                    if not parked[h]: del parked[h]
+                n_parked = sum(map(len, parked.values()))
+
+                while len(inflight) < workers and len(visited) + len(inflight) < max_pages:
+                    if candidates:
+                        url = candidates.pop(0)
+                    elif frontier.urls and n_parked < workers:
+                        url = frontier.pop()
+                    else:
+                        break
+                    if url_key(url) in visited or url in inflight.values(): continue
+                    host = _parsed(url).netloc
+                    if host in busy or (now - host_last[host] < THROTTLE
+                                        and not cached(sess, url)):
+                        parked[host].append(url); n_parked += 1
+                        continue
+                    inflight[pool.submit(polite_get, sess, url, host_last, host_bytes,
+                                         robots, robots_txt)] = url
+                    busy.add(host)
+                for url in reversed(candidates):           # not dispatched this round
+                    parked[_parsed(url).netloc].appendleft(url)
+
+                if not inflight and not parsing and (not parked or len(visited) >= max_pages):
+                    break
+                room = len(inflight) < workers and len(visited) + len(inflight) < max_pages
+                idle = [host_last[h] + THROTTLE - now for h in parked
+                        if h not in busy] if room else []
+                timeout = max(0.0, min(idle)) if idle else None
+                if not inflight and not parsing:
+                    time.sleep(timeout); continue
+
+                done, _ = wait([*inflight, *parsing], timeout=timeout,
+                               return_when=FIRST_COMPLETED)
+                for fut in done:
+                    if fut in parsing:
+                        url, html = parsing.pop(fut)
+                        if isinstance(fut.exception(), BrokenProcessPool):
+                            if pool_ok:                # parse here from now on
+                                tqdm.write("parse worker died; parsing in-process")
+                                pool_ok = False
+                            fut = parse_here(html, url)
+                        try:
+                            kw, desc, title, links = fut.result()
+                        except Exception:
+                            continue
+                        rows.append([url, kw, desc, title])
+                        if len(rows) >= CSV_BATCH:
+                            writer.writerows(rows); rows.clear()
+                        frontier.push_many(links, visited)
+                        if strategy == "dla": frontier.cluster.add(url_key(url))
+                        continue
+
+                    url = inflight.pop(fut)
+                    busy.discard(_parsed(url).netloc)
+                    try:
+                        html, ctype = fut.result()
+                        visited.add(url_key(url)); bar.update(1)
+                        if "text/html" in ctype:
+                            if not pool_ok:
+                                fut = parse_here(html, url)
+                            else:
+                                try:
+                                    fut = parse_pool.submit(_parse_page, html, url)
+                                except BrokenProcessPool as e:  # handled on result
+                                    fut = Future(); fut.set_exception(e)
+                            parsing[fut] = (url, html)
+                    except (PermissionError, MemoryError, requests.exceptions.Timeout):
+                        continue
+                    except Exception:
+                        continue
+    finally:                                   # keep batched rows on Ctrl-C too
+        writer.writerows(rows)
+        bar.close()
+        if robots_cache: save_robots(robots_cache, robots_txt)
 
 # ─── CLI ────────────────────────────────────────────────────────────
 def main():
@@ -217,15 +433,24 @@ def main():
                    default="quantum")
     p.add_argument("--max-pages", type=int, default=100)
     p.add_argument("--csv-out", default="crawl_output.csv")
+    p.add_argument("--workers", type=int, default=WORKERS)
+    p.add_argument("--parsers", type=int, default=None,
+                   help="parse processes (default: CPU count)")
+    p.add_argument("--robots-cache", default="robots_cache.json")
+    p.add_argument("--no-cache", action="store_true",
+                   help=f"do not read or write the {HTTP_CACHE} response cache")
     args = p.parse_args()
 
     seeds = [canon(u.strip()) for u in Path(args.seeds).read_text().splitlines() if u.strip()]
     if not seeds: print("No seeds."); sys.exit(1)
 
-    with open(args.csv_out, "w", newline="", encoding="utf-8") as f:
+    with open(args.csv_out, "w", newline="", encoding="utf-8",
+              buffering=1 << 20) as f:
         writer = csv.writer(f, quoting=csv.QUOTE_ALL)
         writer.writerow(["URL","keywords","description","title"])
-        crawl(seeds, args.strategy, args.max_pages, writer)
+        crawl(seeds, args.strategy, args.max_pages, writer, args.workers,
+              args.robots_cache, None if args.no_cache else HTTP_CACHE,
+              args.parsers)
     print("CSV saved to", args.csv_out)
 
 if __name__ == "__main__":